@@ -8,21 +8,40 @@ import objc
 import json
 import os
 import sys
-from Foundation import NSObject, NSTimer, NSPoint, NSMakePoint, NSUserDefaults
+import time
+from Foundation import NSObject, NSPoint, NSMakePoint, NSUserDefaults, NSRunLoop, NSNotificationCenter, NSURL
 from AppKit import (
     NSApplication, NSWindow, NSView, NSColor, NSTextField,
     NSFont, NSBackingStoreBuffered, NSWindowStyleMaskBorderless,
     NSScreen, NSMakeRect, NSMenu, NSMenuItem, NSAlert, NSAlertFirstButtonReturn,
-    NSImage, NSImageView, NSCompositingOperationSourceOver, NSMakeSize, NSAppleScript,
-    NSEvent, NSStatusBar, NSVariableStatusItemLength
+    NSImage, NSCompositingOperationSourceOver, NSMakeSize, NSAppleScript,
+    NSEvent, NSStatusBar, NSVariableStatusItemLength, NSWorkspace, NSOnState, NSOffState,
+    NSBitmapImageRep, NSGraphicsContext, NSDeviceRGBColorSpace, NSZeroRect,
+    NSWorkspaceDidLaunchApplicationNotification, NSWorkspaceDidTerminateApplicationNotification,
+    NSApplicationWillTerminateNotification, NSWindowDidChangeBackingPropertiesNotification
 )
+from ApplicationServices import (
+    AXObserverCreate, AXObserverAddNotification, AXObserverGetRunLoopSource,
+    AXUIElementCreateApplication, AXUIElementCopyAttributeValue, kAXErrorSuccess,
+    kAXRoleAttribute, kAXParentAttribute, kAXTitleAttribute, kAXMenuBarItemRole,
+    kAXMenuItemSelectedNotification, kAXTitleChangedNotification
+)
+from Quartz import CALayer, kCAGravityResizeAspect
+from CoreFoundation import CFRunLoopAddSource, CFRunLoopRemoveSource, kCFRunLoopDefaultMode
 from Cocoa import (
     NSWindowCollectionBehaviorCanJoinAllSpaces,
     NSWindowCollectionBehaviorStationary,
     NSFloatingWindowLevel,
     NSLeftMouseDown, NSLeftMouseDragged, NSRightMouseDown, NSLeftMouseUp
 )
-import subprocess
+import dispatch
+
+# orjsonがあれば設定ファイルの読み込みに使う（起動を少しでも速くするため）
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 CONFIG_FILE = os.path.expanduser("~/Library/Application Support/ZoomMuteMonitor/config.json")
@@ -37,6 +56,127 @@ else:
     SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
     ICON_DIR = os.path.join(SCRIPT_DIR, "icon")
 
+# 状態ごとのアイコンファイル（パスと存在確認は起動時に一度だけ行う）
+ICON_PATHS = {
+    True: os.path.join(ICON_DIR, "micOff-512.png"),  # ミュート中（赤）
+    False: os.path.join(ICON_DIR, "micOn-512.png"),  # ミュート解除（緑）
+    None: os.path.join(ICON_DIR, "unknown-512.png"),  # 不明
+}
+ICON_EXISTS = {state: os.path.exists(path) for state, path in ICON_PATHS.items()}
+
+# Zoomの「ミーティング」メニューの項目一覧を取得するAppleScript
+# キーワードとの比較はPython側で行うため、スクリプト本体は固定（一度だけコンパイルして使い回す）
+MUTE_STATUS_SCRIPT = '''
+tell application "System Events"
+    set zoomProcName to missing value
+    if (exists process "zoom.us") then
+        set zoomProcName to "zoom.us"
+    else if (exists process "Zoom") then
+        set zoomProcName to "Zoom"
+    else
+        return "not_running"
+    end if
+
+    tell process zoomProcName
+        try
+            set mb to menu bar 1
+            tell menu bar item "ミーティング" of mb
+                set meetingMenuItems to name of menu items of menu 1
+
+                -- メニュー項目を "|" 区切りで返す（ループせずに一括で文字列化）
+                set AppleScript's text item delimiters to "|"
+                set itemList to meetingMenuItems as text
+                set AppleScript's text item delimiters to ""
+                return "items:" & itemList
+            end tell
+        on error errMsg
+            -- メニューアクセスエラー（ミーティング外など）
+            return "error:" & errMsg
+        end try
+    end tell
+end tell
+return "unknown"
+'''
+
+ZOOM_BUNDLE_ID = "us.zoom.xos"
+
+# AppleScript側と同じく、このプロセス名のアプリもZoomとして扱う
+ZOOM_PROCESS_NAMES = ("zoom.us", "Zoom")
+
+# Zoomアプリ全体に登録するAXObserverの通知
+# （アプリ要素に登録すると子孫要素の通知も届くため、コールバックで「ミーティング」メニュー内に絞り込む）
+AX_NOTIFICATIONS = (
+    kAXTitleChangedNotification,
+    kAXMenuItemSelectedNotification,
+)
+
+# 「ミーティング」メニューを探すときに親をたどる最大の深さ
+AX_MAX_MENU_DEPTH = 6
+
+# 「ミーティング」メニューのタイトル変化通知を実際に受け取った後の保険ポーリング間隔（ミリ秒）
+AX_FALLBACK_INTERVAL = 1000
+
+# AXObserverの登録に失敗した時に再試行する間隔（秒）
+AX_RETRY_INTERVAL = 5
+
+# 設定変更から保存までの待ち時間（ミリ秒）
+SAVE_DELAY = 500
+
+
+def is_zoom_app(app):
+    """NSRunningApplicationがZoomかどうか（AppleScriptが受け付けるアプリと同じ条件）"""
+    if app.bundleIdentifier() == ZOOM_BUNDLE_ID:
+        return True
+    if app.localizedName() in ZOOM_PROCESS_NAMES:
+        return True
+    executable_url = app.executableURL()
+    return executable_url is not None and executable_url.lastPathComponent() in ZOOM_PROCESS_NAMES
+
+
+def is_meeting_menu_element(element):
+    """要素が「ミーティング」メニュー内の要素かどうか（親をたどって確認）"""
+    for _ in range(AX_MAX_MENU_DEPTH):
+        err, role = AXUIElementCopyAttributeValue(element, kAXRoleAttribute, None)
+        if err != kAXErrorSuccess:
+            return False
+        if role == kAXMenuBarItemRole:
+            err, title = AXUIElementCopyAttributeValue(element, kAXTitleAttribute, None)
+            return err == kAXErrorSuccess and title == "ミーティング"
+
+        err, element = AXUIElementCopyAttributeValue(element, kAXParentAttribute, None)
+        if err != kAXErrorSuccess or element is None:
+            return False
+    return False
+
+
+def parse_mute_status(status, muted_keyword, unmuted_keyword):
+    """AppleScriptの結果を (ミュート状態, エラー情報) に変換"""
+    if status.startswith("items:"):
+        # メニュー項目とキーワードを完全一致で比較
+        menu_items = status[6:].split('|')  # "items:" の後の部分
+        item_set = set(menu_items)
+        if muted_keyword in item_set:
+            return True, None
+        if unmuted_keyword in item_set:
+            return False, None
+
+        # どちらも見つからなかった場合（デバッグ情報付き）
+        error_details = f"キーワードが見つかりません\n\nミュートキーワード: {muted_keyword}\nミュート解除キーワード: {unmuted_keyword}\n\n画面上部ステータスバーのZoomアイコンを押した時に表示される項目を確認してください\n\n【実際のメニュー項目】\n"
+        for item in menu_items:
+            if item:
+                error_details += f"- {item}\n"
+        return None, error_details
+    elif status == "not_running":
+        return None, "Zoomが起動していません"
+    elif status.startswith("error:"):
+        # AppleScriptエラー
+        error_msg = status[6:]
+        return None, f"AppleScriptエラー:\n{error_msg}\n\nアクセシビリティ権限を確認してください"
+    elif status == "unknown":
+        return None, f"キーワードが見つかりません\n\nミュートキーワード: {muted_keyword}\nミュート解除キーワード: {unmuted_keyword}\n\n画面上部ステータスバーのZoomアイコンを押した時に表示される項目を確認してください"
+    else:
+        return None, f"不明なステータス: {status}"
+
 
 class Config:
     """設定管理クラス"""
@@ -51,45 +191,86 @@ class Config:
         self.opacity = 50  # 透過度（10〜100%）
         self.click_through = False  # クリック透過
         self.hide_unknown = False  # ?のとき非表示
+        self.dirty = False  # 未保存の変更があるか
+        self._save_generation = 0  # 保存予約の世代（新しい予約で古い予約を無効化）
+        self._last_saved_hash = None  # 最後に保存した内容のハッシュ
         self.load()
 
     def load(self):
         """設定ファイルから読み込み"""
         try:
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r') as f:
-                    data = json.load(f)
-                    self.window_x = data.get('window_x')
-                    self.window_y = data.get('window_y')
-                    self.icon_size = data.get('icon_size', 100)
-                    self.muted_keyword = data.get('muted_keyword', "オーディオのミュート解除")
-                    self.unmuted_keyword = data.get('unmuted_keyword', "オーディオのミュート")
-                    self.check_interval = data.get('check_interval', 200)
-                    self.opacity = data.get('opacity', 50)
-                    self.click_through = data.get('click_through', False)
-                    self.hide_unknown = data.get('hide_unknown', False)
+            # 存在確認はせずに開き、ファイルがなければデフォルト値のまま
+            with open(CONFIG_FILE, 'rb') as f:
+                data = _json_loads(f.read())
+            self.window_x = data.get('window_x')
+            self.window_y = data.get('window_y')
+            self.icon_size = data.get('icon_size', 100)
+            self.muted_keyword = data.get('muted_keyword', "オーディオのミュート解除")
+            self.unmuted_keyword = data.get('unmuted_keyword', "オーディオのミュート")
+            self.check_interval = data.get('check_interval', 200)
+            self.opacity = data.get('opacity', 50)
+            self.click_through = data.get('click_through', False)
+            self.hide_unknown = data.get('hide_unknown', False)
+
+            # 読み込んだ内容を保存済みとして記録（変更がなければ保存時に書き込まない）
+            self._last_saved_hash = hash(self.dumps())
+        except FileNotFoundError:
+            return
         except Exception as e:
             print(f"Failed to load config: {e}")
 
+    def dumps(self):
+        """設定をJSON文字列に変換"""
+        return json.dumps({
+            'window_x': self.window_x,
+            'window_y': self.window_y,
+            'icon_size': self.icon_size,
+            'muted_keyword': self.muted_keyword,
+            'unmuted_keyword': self.unmuted_keyword,
+            'check_interval': self.check_interval,
+            'opacity': self.opacity,
+            'click_through': self.click_through,
+            'hide_unknown': self.hide_unknown
+        }, indent=2)
+
     def save(self):
-        """設定ファイルに保存"""
+        """設定ファイルに保存（一時ファイルに書いてから置き換える）"""
         try:
+            payload = self.dumps()
+            payload_hash = hash(payload)
+
+            # 前回保存した内容と同じなら書き込まない
+            if payload_hash == self._last_saved_hash:
+                self.dirty = False
+                return
+
             os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump({
-                    'window_x': self.window_x,
-                    'window_y': self.window_y,
-                    'icon_size': self.icon_size,
-                    'muted_keyword': self.muted_keyword,
-                    'unmuted_keyword': self.unmuted_keyword,
-                    'check_interval': self.check_interval,
-                    'opacity': self.opacity,
-                    'click_through': self.click_through,
-                    'hide_unknown': self.hide_unknown
-                }, f, indent=2)
+            tmp_file = CONFIG_FILE + ".tmp"
+            with open(tmp_file, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_file, CONFIG_FILE)
+            self._last_saved_hash = payload_hash
+            self.dirty = False
         except Exception as e:
             print(f"Failed to save config: {e}")
 
+    def save_debounced(self):
+        """少し待ってから保存（連続した変更は最後の1回にまとめる）"""
+        self.dirty = True
+        self._save_generation += 1
+        generation = self._save_generation
+
+        def save_if_latest():
+            # より新しい保存予約があればそちらに任せる
+            if generation == self._save_generation and self.dirty:
+                self.save()
+
+        dispatch.dispatch_after(
+            dispatch.dispatch_time(dispatch.DISPATCH_TIME_NOW, SAVE_DELAY * 1000000),
+            dispatch.dispatch_get_main_queue(),
+            save_if_latest
+        )
+
 
 class MuteStatusView(NSView):
     """ミュート状態を表示するビュー"""
@@ -101,44 +282,45 @@ class MuteStatusView(NSView):
 
         self.monitor = monitor
         self.drag_start = None
+        self._last_is_muted = "unset"  # 前回表示した状態（初回は必ず描画）
 
         # ラベルのサイズを計算
         label_size = frame.size.width - 20
 
-        # 画像ビュー（画像アイコン用）
-        self.imageView = NSImageView.alloc().initWithFrame_(NSMakeRect(10, 10, label_size, label_size))
-        self.imageView.setImageScaling_(1)  # NSImageScaleProportionallyUpOrDown
+        # アイコン表示用のビュー（レイヤーホスティング）
+        # レイヤーに直接画像を設定し、拡大縮小はCore Animationに任せる
+        self.iconView = NSView.alloc().initWithFrame_(NSMakeRect(10, 10, label_size, label_size))
+        self.iconView.setLayer_(CALayer.layer())
+        self.iconView.setWantsLayer_(True)
+        self.iconView.layer().setContentsGravity_(kCAGravityResizeAspect)
 
-        self.addSubview_(self.imageView)
+        self.addSubview_(self.iconView)
+
+        # 右クリックメニューは一度だけ作成
+        self.buildMenu()
 
         return self
 
     def updateStatus_(self, is_muted):
         """ミュート状態を更新"""
-        # 状態に応じてアイコンファイルを選択
-        if is_muted is None:
-            # 不明 - unknown-512.png
-            icon_path = os.path.join(ICON_DIR, "unknown-512.png")
-        elif is_muted:
-            # ミュート中 - micOff-512.png（赤）
-            icon_path = os.path.join(ICON_DIR, "micOff-512.png")
-        else:
-            # ミュート解除 - micOn-512.png（緑）
-            icon_path = os.path.join(ICON_DIR, "micOn-512.png")
-
-        if not os.path.exists(icon_path):
+        # 状態が変わっていなければ何もしない
+        if is_muted == self._last_is_muted:
             return
 
-        # 画像を読み込み
-        image = NSImage.alloc().initWithContentsOfFile_(icon_path)
-        if image is not None:
-            # サイズを設定して表示
-            new_size = NSMakeSize(self.monitor.config.icon_size, self.monitor.config.icon_size)
-            image.setSize_(new_size)
-            self.imageView.setImage_(image)
+        monitor = self.monitor
+        config = monitor.config
+        size = config.icon_size
+        icon_view = self.iconView
+
+        # 事前にレンダリング済みのアイコンを表示
+        image = monitor._icons.get((is_muted, size))
+        if image is None:
+            return
+        icon_view.layer().setContents_(image)
 
-            # 透過度を設定
-            self.imageView.setAlphaValue_(self.monitor.config.opacity / 100.0)
+        # 透過度を設定
+        icon_view.setAlphaValue_(config.opacity / 100.0)
+        self._last_is_muted = is_muted
 
     def updateIconSize_(self, size):
         """アイコンサイズを更新"""
@@ -149,12 +331,18 @@ class MuteStatusView(NSView):
         frame.size.height = new_window_size
         self.window().setFrame_display_(frame, True)
 
-        # 画像ビューのサイズも調整
+        # アイコン表示用ビューのサイズも調整
         new_size = new_window_size - 20
-        image_frame = self.imageView.frame()
-        image_frame.size.width = new_size
-        image_frame.size.height = new_size
-        self.imageView.setFrame_(image_frame)
+        icon_frame = self.iconView.frame()
+        icon_frame.size.width = new_size
+        icon_frame.size.height = new_size
+        self.iconView.setFrame_(icon_frame)
+
+        # 新しいサイズ用のアイコンで現在の状態を描き直す
+        current = self._last_is_muted
+        self._last_is_muted = "unset"
+        if current != "unset":
+            self.updateStatus_(current)
 
     def mouseDown_(self, event):
         """マウスダウンイベント（ドラッグ開始）"""
@@ -187,24 +375,26 @@ class MuteStatusView(NSView):
             window_frame = self.window().frame()
             self.monitor.config.window_x = window_frame.origin.x
             self.monitor.config.window_y = window_frame.origin.y
-            self.monitor.config.save()
+            self.monitor.config.save_debounced()
             self.drag_start = None
 
-    def rightMouseDown_(self, event):
-        """右クリックメニューを表示"""
+    def buildMenu(self):
+        """右クリックメニューを作成（一度だけ作成し、表示時に状態だけ更新する）"""
         menu = NSMenu.alloc().init()
 
         # アイコンサイズ設定（50px単位で500pxまで）
         size_menu = NSMenu.alloc().init()
+        self._size_items = {}
         for size in [50, 100, 150, 200, 250, 300, 350, 400, 450, 500]:
             item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                f"{size}px" + (" ✓" if size == self.monitor.config.icon_size else ""),
+                f"{size}px",
                 "setIconSize:",
                 ""
             )
             item.setTag_(size)
             item.setTarget_(self.monitor)
             size_menu.addItem_(item)
+            self._size_items[size] = item
 
         size_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             "アイコンサイズ", None, ""
@@ -214,16 +404,17 @@ class MuteStatusView(NSView):
 
         # 監視間隔設定
         interval_menu = NSMenu.alloc().init()
+        self._interval_items = {}
         for interval in [10, 30, 50, 100, 200, 300, 500, 1000]:
-            label = f"{interval}ms" + (" ✓" if interval == self.monitor.config.check_interval else "")
             item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                label,
+                f"{interval}ms",
                 "setCheckInterval:",
                 ""
             )
             item.setTag_(interval)
             item.setTarget_(self.monitor)
             interval_menu.addItem_(item)
+            self._interval_items[interval] = item
 
         interval_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             "監視間隔", None, ""
@@ -233,16 +424,17 @@ class MuteStatusView(NSView):
 
         # 透過度設定
         opacity_menu = NSMenu.alloc().init()
+        self._opacity_items = {}
         for opacity in [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]:
-            label = f"{opacity}%" + (" ✓" if opacity == self.monitor.config.opacity else "")
             item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                label,
+                f"{opacity}%",
                 "setOpacity:",
                 ""
             )
             item.setTag_(opacity)
             item.setTarget_(self.monitor)
             opacity_menu.addItem_(item)
+            self._opacity_items[opacity] = item
 
         opacity_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             "透過度", None, ""
@@ -271,15 +463,14 @@ class MuteStatusView(NSView):
 
         menu.addItem_(NSMenuItem.separatorItem())
 
-        # エラー表示（unknown状態の時のみ）
-        if self.monitor.last_error is not None:
-            error_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                "エラー表示",
-                "showError:",
-                ""
-            )
-            error_item.setTarget_(self.monitor)
-            menu.addItem_(error_item)
+        # エラー表示（unknown状態の時のみ表示）
+        self._error_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            "エラー表示",
+            "showError:",
+            ""
+        )
+        self._error_item.setTarget_(self.monitor)
+        menu.addItem_(self._error_item)
 
         # アクセシビリティ設定を開く
         accessibility_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
@@ -293,14 +484,13 @@ class MuteStatusView(NSView):
         menu.addItem_(NSMenuItem.separatorItem())
 
         # ログイン時に自動起動
-        is_login_item = self.monitor.isLoginItem()
-        login_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "ログイン時に自動起動" + (" ✓" if is_login_item else ""),
+        self._login_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            "ログイン時に自動起動",
             "toggleLoginItem:",
             ""
         )
-        login_item.setTarget_(self.monitor)
-        menu.addItem_(login_item)
+        self._login_item.setTarget_(self.monitor)
+        menu.addItem_(self._login_item)
 
         menu.addItem_(NSMenuItem.separatorItem())
 
@@ -324,8 +514,24 @@ class MuteStatusView(NSView):
         quit_item.setTarget_(NSApplication.sharedApplication())
         menu.addItem_(quit_item)
 
+        self._menu = menu
+
+    def rightMouseDown_(self, event):
+        """右クリックメニューを表示"""
+        config = self.monitor.config
+
+        # 作成済みのメニューのチェック状態だけを更新
+        for size, item in self._size_items.items():
+            item.setState_(NSOnState if size == config.icon_size else NSOffState)
+        for interval, item in self._interval_items.items():
+            item.setState_(NSOnState if interval == config.check_interval else NSOffState)
+        for opacity, item in self._opacity_items.items():
+            item.setState_(NSOnState if opacity == config.opacity else NSOffState)
+        self._error_item.setHidden_(self.monitor.last_error is None)
+        self._login_item.setState_(NSOnState if self.monitor.isLoginItem() else NSOffState)
+
         # メニューを表示
-        menu.popUpMenuPositioningItem_atLocation_inView_(
+        self._menu.popUpMenuPositioningItem_atLocation_inView_(
             None,
             event.locationInWindow(),
             self
@@ -342,13 +548,79 @@ class ZoomMuteMonitor(NSObject):
 
         self.window = None
         self.view = None
-        self.timer = None
+        self._timer_source = None
+        self._timer_suspended = True  # タイマーが一時停止中か（作成直後は停止状態）
+        # AppleScript（NSAppleScript）はすべてこのシリアルキューで実行し、同時に実行されないようにする
+        # 注意: AppleはNSAppleScriptをメインスレッド専用としており、1つのキューへの集約は回避策であって
+        # スレッド安全性が保証されるわけではない
+        self._poll_queue = dispatch.dispatch_queue_create(b"zmm.poll", dispatch.DISPATCH_QUEUE_SERIAL)
+        self._poll_in_flight = False  # ミュート状態の問い合わせ中かどうか
+        self._poll_pending = False  # 問い合わせ中に更新要求が来たかどうか
+        self._last_is_muted = "unset"  # 前回反映した状態（初回は必ず反映）
+        self._ax_observer = None  # Zoomのメニューを監視するAXObserver
+        self._ax_callback = None  # AXObserverのコールバック（参照を保持）
+        self._ax_events_seen = False  # 「ミーティング」メニューのタイトル変化通知を受け取ったか
+        self._ax_last_bind_attempt = 0.0  # AXObserverの登録を最後に試みた時刻
+        self._zoom_running = self.findZoomPid() is not None  # Zoomの起動状態（起動・終了通知で更新）
         self.config = Config()
         self.last_error = None  # 最後のエラー情報を保存
+        self._source_icons = {}  # 状態 -> 元画像（NSImage）
+        self._icons = {}  # (状態, アイコンサイズ) -> レンダリング済みCGImage（現在のサイズ分のみ）
+        self._icons_key = None  # _iconsをレンダリングした (アイコンサイズ, 画面倍率)
+        self._is_login_item_cache = None  # ログイン項目の登録状態（未取得ならNone）
+        self._login_item_loading = False  # ログイン項目の登録状態を取得中かどうか
         self.status_item = None  # メニューバーアイテム
+        self._open_alerts = {}  # 表示中のアラートのウィンドウ -> (NSAlert, 完了時の処理)
+
+        # ミュート状態取得用のAppleScriptは起動時に一度だけコンパイルする
+        # （AppleScriptの実行はすべてポーリング用のシリアルキューに集約する）
+        self._compiled_script = NSAppleScript.alloc().initWithSource_(MUTE_STATUS_SCRIPT)
+        dispatch.dispatch_async(
+            self._poll_queue, lambda: self._compiled_script.compileAndReturnError_(None)
+        )
 
         return self
 
+    def renderIconsForSize_(self, size):
+        """指定サイズの各状態のアイコンをビットマップにレンダリングしてキャッシュ"""
+        # アイコン表示用ビューの実際の大きさ（ウィンドウ = サイズ + 40、ビュー = ウィンドウ - 20）と
+        # ウィンドウがある画面の倍率に合わせる
+        if self.window is not None:
+            scale = self.window.backingScaleFactor()
+        else:
+            scale = NSScreen.mainScreen().backingScaleFactor()
+        pixels = int((size + 20) * scale)
+
+        # 使わなくなったサイズ・倍率のビットマップは破棄（常駐メモリを現在のサイズ分だけにする）
+        if (size, scale) != self._icons_key:
+            self._icons.clear()
+            self._icons_key = (size, scale)
+
+        for is_muted, icon_path in ICON_PATHS.items():
+            if (is_muted, size) in self._icons or not ICON_EXISTS[is_muted]:
+                continue
+
+            # 元画像は一度だけ読み込む
+            source = self._source_icons.get(is_muted)
+            if source is None:
+                source = NSImage.alloc().initWithContentsOfFile_(icon_path)
+                if source is None:
+                    continue
+                self._source_icons[is_muted] = source
+
+            # 表示サイズちょうどのピクセル数で描画
+            rep = NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bytesPerRow_bitsPerPixel_(
+                None, pixels, pixels, 8, 4, True, False, NSDeviceRGBColorSpace, 0, 0
+            )
+            NSGraphicsContext.saveGraphicsState()
+            NSGraphicsContext.setCurrentContext_(NSGraphicsContext.graphicsContextWithBitmapImageRep_(rep))
+            source.drawInRect_fromRect_operation_fraction_(
+                NSMakeRect(0, 0, pixels, pixels), NSZeroRect, NSCompositingOperationSourceOver, 1.0
+            )
+            NSGraphicsContext.restoreGraphicsState()
+
+            self._icons[(is_muted, size)] = rep.CGImage()
+
     def setupWindow(self):
         """透過ウィンドウをセットアップ"""
         # 画面サイズを取得
@@ -387,66 +659,40 @@ class ZoomMuteMonitor(NSObject):
         )
         self.window.setAnimationBehavior_(2)  # NSWindowAnimationBehaviorNone = 2
 
+        # 現在のサイズのアイコンを事前にレンダリング（サイズを変更した時に作り直す）
+        self.renderIconsForSize_(self.config.icon_size)
+
+        # 倍率の違う画面に移動したらアイコンを作り直す
+        NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+            self, 'windowDidChangeBackingProperties:', NSWindowDidChangeBackingPropertiesNotification, self.window
+        )
+
         # ビューを作成
         self.view = MuteStatusView.alloc().initWithFrame_monitor_(window_frame, self)
         self.window.setContentView_(self.view)
         self.window.makeKeyAndOrderFront_(None)
 
+    def windowDidChangeBackingProperties_(self, notification):
+        """ウィンドウの画面倍率が変わった時に呼ばれる"""
+        size = self.config.icon_size
+        self.renderIconsForSize_(size)
+        self.view.updateIconSize_(size)
+
     def checkMuteStatus(self):
         """AppleScriptでZoomのミュート状態をチェック"""
-        script = f'''
-tell application "System Events"
-    set zoomProcName to missing value
-    if (exists process "zoom.us") then
-        set zoomProcName to "zoom.us"
-    else if (exists process "Zoom") then
-        set zoomProcName to "Zoom"
-    else
-        return "not_running"
-    end if
-
-    tell process zoomProcName
-        try
-            set mb to menu bar 1
-            tell menu bar item "ミーティング" of mb
-                set meetingMenuItems to name of menu items of menu 1
-                set mutedKeyword to "{self.config.muted_keyword}"
-                set unmutedKeyword to "{self.config.unmuted_keyword}"
-
-                -- まずミュート状態をチェック（早期リターン）
-                repeat with meetingItem in meetingMenuItems
-                    if (meetingItem as text) is equal to mutedKeyword then
-                        return "muted"
-                    end if
-                end repeat
-
-                -- 次にミュート解除状態をチェック（早期リターン）
-                repeat with meetingItem in meetingMenuItems
-                    if (meetingItem as text) is equal to unmutedKeyword then
-                        return "unmuted"
-                    end if
-                end repeat
-
-                -- どちらも見つからなかった場合（デバッグ情報）
-                set itemList to ""
-                repeat with menuItem in meetingMenuItems
-                    set itemList to itemList & (menuItem as text) & "|"
-                end repeat
-                return "unknown:" & itemList
-            end tell
-        on error errMsg
-            -- メニューアクセスエラー（ミーティング外など）
-            return "error:" & errMsg
-        end try
-    end tell
-end tell
-return "unknown"
-'''
+        # 設定値はまとめてローカル変数に読み出しておく
+        cfg = self.config
+        muted_kw = cfg.muted_keyword
+        unmuted_kw = cfg.unmuted_keyword
+
+        # Zoomが起動していなければAppleScriptを実行しない
+        if not self._zoom_running:
+            self.last_error = "Zoomが起動していません"
+            return None
 
         try:
-            # NSAppleScriptを使用（.appから実行する場合、アプリ自体に権限が付与される）
-            applescript = NSAppleScript.alloc().initWithSource_(script)
-            result, error = applescript.executeAndReturnError_(None)
+            # コンパイル済みのNSAppleScriptを再利用（.appから実行する場合、アプリ自体に権限が付与される）
+            result, error = self._compiled_script.executeAndReturnError_(None)
 
             if error:
                 # AppleScriptエラー
@@ -456,44 +702,50 @@ return "unknown"
 
             status = str(result.stringValue()) if result else "unknown"
 
-            if status == "muted":
-                self.last_error = None
-                return True
-            elif status == "unmuted":
-                self.last_error = None
-                return False
-            else:
-                # エラー情報を記録（詳細版）
-                if status == "not_running":
-                    self.last_error = "Zoomが起動していません"
-                elif status.startswith("unknown:"):
-                    # デバッグ情報付きのunknown
-                    menu_items = status[8:]  # "unknown:" の後の部分
-                    error_details = f"キーワードが見つかりません\n\nミュートキーワード: {self.config.muted_keyword}\nミュート解除キーワード: {self.config.unmuted_keyword}\n\n画面上部ステータスバーのZoomアイコンを押した時に表示される項目を確認してください\n\n【実際のメニュー項目】\n"
-                    for item in menu_items.split('|'):
-                        if item:
-                            error_details += f"- {item}\n"
-                    self.last_error = error_details
-                elif status.startswith("error:"):
-                    # AppleScriptエラー
-                    error_msg = status[6:]
-                    self.last_error = f"AppleScriptエラー:\n{error_msg}\n\nアクセシビリティ権限を確認してください"
-                elif status == "unknown":
-                    self.last_error = f"キーワードが見つかりません\n\nミュートキーワード: {self.config.muted_keyword}\nミュート解除キーワード: {self.config.unmuted_keyword}\n\n画面上部ステータスバーのZoomアイコンを押した時に表示される項目を確認してください"
-                else:
-                    self.last_error = f"不明なステータス: {status}"
-                return None
+            # メニュー項目とキーワードを比較してミュート状態を判定
+            is_muted, self.last_error = parse_mute_status(status, muted_kw, unmuted_kw)
+            return is_muted
         except Exception as e:
             self.last_error = f"予期しないエラー:\n{type(e).__name__}: {str(e)}"
             return None
 
     def updateStatus_(self, timer):
         """定期的に呼ばれてステータスを更新"""
-        is_muted = self.checkMuteStatus()
+        # 前回の問い合わせが終わっていなければ、終わった後に一度だけ問い合わせ直す（キューに溜めない）
+        if self._poll_in_flight:
+            self._poll_pending = True
+            return
+        self._poll_in_flight = True
+
+        # AppleScriptはバックグラウンドのシリアルキューで実行し、結果はメインスレッドで反映
+        def poll():
+            is_muted = self.checkMuteStatus()
+            dispatch.dispatch_async(
+                dispatch.dispatch_get_main_queue(), lambda: self.applyStatus_(is_muted)
+            )
+
+        dispatch.dispatch_async(self._poll_queue, poll)
+
+    def applyStatus_(self, is_muted):
+        """取得したミュート状態を画面に反映（メインスレッドで呼ばれる）"""
+        self._poll_in_flight = False
+        if self._poll_pending:
+            # 問い合わせ中に届いた更新要求をここで処理
+            self._poll_pending = False
+            self.updateStatus_(None)
+
         self.view.updateStatus_(is_muted)
+        self.updateObserverState_(is_muted)
+
+        # 状態が変わった時だけメニューバーアイコンとウィンドウ表示を更新
+        if is_muted == self._last_is_muted:
+            return
+        self._last_is_muted = is_muted
         self.updateStatusBarIcon_(is_muted)  # メニューバーアイコンも更新
+        self.updateWindowVisibility_(is_muted)
 
-        # ?のとき非表示が有効で、unknown状態の場合はウィンドウを隠す
+    def updateWindowVisibility_(self, is_muted):
+        """?のとき非表示が有効で、unknown状態の場合はウィンドウを隠す"""
         if self.window:
             if self.config.hide_unknown and is_muted is None:
                 self.window.orderOut_(None)
@@ -504,57 +756,74 @@ return "unknown"
         """アイコンサイズを変更"""
         size = sender.tag()
         self.config.icon_size = size
-        self.config.save()
+        self.config.save_debounced()
+        self.renderIconsForSize_(size)
         self.view.updateIconSize_(size)
-        self.createStatusBarMenu()
 
     def setCheckInterval_(self, sender):
         """監視間隔を変更"""
         interval = sender.tag()
         self.config.check_interval = interval
-        self.config.save()
-
-        # タイマーを再起動
-        if self.timer:
-            self.timer.invalidate()
-        self.timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            interval / 1000.0,  # ミリ秒を秒に変換
-            self,
-            'updateStatus:',
-            None,
-            True
-        )
-        self.createStatusBarMenu()
+        self.config.save_debounced()
+
+        # タイマーの間隔を更新（ソースは作り直さない）
+        self.scheduleTimer()
 
     def setOpacity_(self, sender):
         """透過度を変更"""
         opacity = sender.tag()
         self.config.opacity = opacity
-        self.config.save()
+        self.config.save_debounced()
 
         # 現在の状態を再描画して透過度を反映
-        self.view.imageView.setAlphaValue_(opacity / 100.0)
-        self.createStatusBarMenu()
+        self.view.iconView.setAlphaValue_(opacity / 100.0)
 
     def toggleClickThrough_(self, sender):
         """クリック透過を切り替え"""
         self.config.click_through = not self.config.click_through
-        self.config.save()
+        self.config.save_debounced()
 
         # ウィンドウのマウスイベント設定を更新
         if self.window:
             self.window.setIgnoresMouseEvents_(self.config.click_through)
 
-        # メニューを再作成して状態を反映
-        self.createStatusBarMenu()
-
     def toggleHideUnknown_(self, sender):
         """?のとき非表示を切り替え"""
         self.config.hide_unknown = not self.config.hide_unknown
-        self.config.save()
-
-        # メニューを再作成して状態を反映
-        self.createStatusBarMenu()
+        self.config.save_debounced()
+
+        # 現在の状態で表示/非表示を反映
+        if self._last_is_muted != "unset":
+            self.updateWindowVisibility_(self._last_is_muted)
+
+    def presentAlert_completion_(self, alert, completion):
+        """アラートを通常のウィンドウとして表示（モーダルにせず、ランループを止めない）"""
+        # ボタンの押下はモーダルセッションの代わりに alertButtonPressed: で受け取る
+        alert.layout()
+        for index, button in enumerate(alert.buttons()):
+            button.setTag_(NSAlertFirstButtonReturn + index)
+            button.setTarget_(self)
+            button.setAction_('alertButtonPressed:')
+
+        window = alert.window()
+        self._open_alerts[window] = (alert, completion)
+
+        NSApplication.sharedApplication().activateIgnoringOtherApps_(True)
+        window.setLevel_(NSFloatingWindowLevel)
+        window.center()
+        window.makeKeyAndOrderFront_(None)
+
+        # 入力欄があればすぐに入力できるようにする
+        if alert.accessoryView() is not None:
+            window.makeFirstResponder_(alert.accessoryView())
+
+    def alertButtonPressed_(self, sender):
+        """presentAlert_completion_ で表示したアラートのボタンが押された"""
+        window = sender.window()
+        alert, completion = self._open_alerts.pop(window, (None, None))
+        window.orderOut_(None)
+        if completion is not None:
+            completion(sender.tag())
 
     def showError_(self, sender):
         """エラー情報を表示"""
@@ -567,17 +836,49 @@ return "unknown"
             alert.setInformativeText_("エラー情報はありません")
 
         alert.addButtonWithTitle_("OK")
-        alert.runModal()
+        self.presentAlert_completion_(alert, None)
 
     def openAccessibilitySettings_(self, sender):
         """アクセシビリティ設定を開く"""
-        subprocess.run([
-            'open',
+        NSWorkspace.sharedWorkspace().openURL_(NSURL.URLWithString_(
             'x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility'
-        ])
+        ))
 
     def isLoginItem(self):
-        """ログイン項目に登録されているかチェック"""
+        """ログイン項目に登録されているかチェック（結果はキャッシュする）"""
+        # 未取得の間は未登録として扱い、バックグラウンドで取得してからメニューに反映する
+        if self._is_login_item_cache is None:
+            self.loadLoginItemState()
+            return False
+        return self._is_login_item_cache
+
+    def loadLoginItemState(self):
+        """ログイン項目の登録状態をバックグラウンドで取得してキャッシュ"""
+        if self._login_item_loading:
+            return
+        self._login_item_loading = True
+
+        def query():
+            is_login_item = self.queryLoginItem()
+
+            def store():
+                self._login_item_loading = False
+                # 取得中に切り替えが行われていたら、そちらの結果を優先
+                if self._is_login_item_cache is None:
+                    self._is_login_item_cache = is_login_item
+                    self.loginItemStateChanged()
+
+            dispatch.dispatch_async(dispatch.dispatch_get_main_queue(), store)
+
+        dispatch.dispatch_async(self._poll_queue, query)
+
+    def loginItemStateChanged(self):
+        """ログイン項目の登録状態をメニューに反映"""
+        if self.status_item is not None:
+            self.updateStatusBarMenu()
+
+    def queryLoginItem(self):
+        """AppleScriptでログイン項目の登録状態を取得"""
         try:
             # アプリのパスを取得
             if getattr(sys, 'frozen', False):
@@ -618,59 +919,60 @@ end tell
                 alert.setMessageText_("エラー")
                 alert.setInformativeText_("この機能は.appとしてビルドされた場合のみ利用可能です。")
                 alert.addButtonWithTitle_("OK")
-                alert.runModal()
+                self.presentAlert_completion_(alert, None)
                 return
 
-            if self.isLoginItem():
-                # 登録解除
-                script = '''
+            # AppleScriptはポーリング用のシリアルキューで実行し、結果の表示はメインスレッドで行う
+            def run():
+                # 登録状態が未取得ならここで取得（メインスレッドを待たせない）
+                is_login_item = self._is_login_item_cache
+                if is_login_item is None:
+                    is_login_item = self.queryLoginItem()
+
+                if is_login_item:
+                    # 登録解除
+                    script = '''
 tell application "System Events"
     delete login item "ZoomMuteMonitor"
 end tell
 '''
-                applescript = NSAppleScript.alloc().initWithSource_(script)
-                result, error = applescript.executeAndReturnError_(None)
-
-                if error:
-                    alert = NSAlert.alloc().init()
-                    alert.setMessageText_("エラー")
-                    alert.setInformativeText_("ログイン項目の解除に失敗しました。")
-                    alert.addButtonWithTitle_("OK")
-                    alert.runModal()
+                    failure_message = "ログイン項目の解除に失敗しました。"
+                    success_message = "ログイン時の自動起動を解除しました。"
                 else:
-                    alert = NSAlert.alloc().init()
-                    alert.setMessageText_("成功")
-                    alert.setInformativeText_("ログイン時の自動起動を解除しました。")
-                    alert.addButtonWithTitle_("OK")
-                    alert.runModal()
-            else:
-                # 登録
-                script = f'''
+                    # 登録
+                    script = f'''
 tell application "System Events"
     make login item at end with properties {{path:"{app_path}", hidden:false}}
 end tell
 '''
+                    failure_message = "ログイン項目の登録に失敗しました。"
+                    success_message = "ログイン時に自動起動するように設定しました。"
+
                 applescript = NSAppleScript.alloc().initWithSource_(script)
                 result, error = applescript.executeAndReturnError_(None)
 
-                if error:
-                    alert = NSAlert.alloc().init()
-                    alert.setMessageText_("エラー")
-                    alert.setInformativeText_("ログイン項目の登録に失敗しました。")
-                    alert.addButtonWithTitle_("OK")
-                    alert.runModal()
-                else:
+                def finish():
                     alert = NSAlert.alloc().init()
-                    alert.setMessageText_("成功")
-                    alert.setInformativeText_("ログイン時に自動起動するように設定しました。")
+                    if error:
+                        alert.setMessageText_("エラー")
+                        alert.setInformativeText_(failure_message)
+                    else:
+                        self._is_login_item_cache = not is_login_item
+                        self.loginItemStateChanged()
+                        alert.setMessageText_("成功")
+                        alert.setInformativeText_(success_message)
                     alert.addButtonWithTitle_("OK")
-                    alert.runModal()
+                    self.presentAlert_completion_(alert, None)
+
+                dispatch.dispatch_async(dispatch.dispatch_get_main_queue(), finish)
+
+            dispatch.dispatch_async(self._poll_queue, run)
         except Exception as e:
             alert = NSAlert.alloc().init()
             alert.setMessageText_("エラー")
             alert.setInformativeText_(f"予期しないエラー: {str(e)}")
             alert.addButtonWithTitle_("OK")
-            alert.runModal()
+            self.presentAlert_completion_(alert, None)
 
     def setMutedKeyword_(self, sender):
         """ミュート検知キーワードを設定"""
@@ -693,12 +995,14 @@ end tell
         input_field.setStringValue_(self.config.muted_keyword)
         alert.setAccessoryView_(input_field)
 
-        response = alert.runModal()
-        if response == NSAlertFirstButtonReturn:
-            new_keyword = input_field.stringValue()
-            if new_keyword:
-                self.config.muted_keyword = new_keyword
-                self.config.save()
+        def completion(response):
+            if response == NSAlertFirstButtonReturn:
+                new_keyword = input_field.stringValue()
+                if new_keyword:
+                    self.config.muted_keyword = new_keyword
+                    self.config.save_debounced()
+
+        self.presentAlert_completion_(alert, completion)
 
     def setUnmutedKeyword_(self, sender):
         """ミュート解除検知キーワードを設定"""
@@ -721,21 +1025,22 @@ end tell
         input_field.setStringValue_(self.config.unmuted_keyword)
         alert.setAccessoryView_(input_field)
 
-        response = alert.runModal()
-        if response == NSAlertFirstButtonReturn:
-            new_keyword = input_field.stringValue()
-            if new_keyword:
-                self.config.unmuted_keyword = new_keyword
-                self.config.save()
+        def completion(response):
+            if response == NSAlertFirstButtonReturn:
+                new_keyword = input_field.stringValue()
+                if new_keyword:
+                    self.config.unmuted_keyword = new_keyword
+                    self.config.save_debounced()
+
+        self.presentAlert_completion_(alert, completion)
 
     def setupStatusBar(self):
         """メニューバーにステータスアイテムを作成"""
         self.status_item = NSStatusBar.systemStatusBar().statusItemWithLength_(NSVariableStatusItemLength)
 
         # 初期アイコンを設定（unknown状態）
-        icon_path = os.path.join(ICON_DIR, "unknown-512.png")
-        if os.path.exists(icon_path):
-            icon = NSImage.alloc().initWithContentsOfFile_(icon_path)
+        if ICON_EXISTS[None]:
+            icon = NSImage.alloc().initWithContentsOfFile_(ICON_PATHS[None])
             if icon:
                 # メニューバー用にサイズ調整（18x18が標準）
                 icon.setSize_(NSMakeSize(18, 18))
@@ -746,20 +1051,22 @@ end tell
         self.createStatusBarMenu()
 
     def createStatusBarMenu(self):
-        """ステータスバーのメニューを作成"""
+        """ステータスバーのメニューを作成（一度だけ作成し、表示時に状態だけ更新する）"""
         menu = NSMenu.alloc().init()
 
         # アイコンサイズ設定（50px単位で500pxまで）
         size_menu = NSMenu.alloc().init()
+        self._status_size_items = {}
         for size in [50, 100, 150, 200, 250, 300, 350, 400, 450, 500]:
             item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                f"{size}px" + (" ✓" if size == self.config.icon_size else ""),
+                f"{size}px",
                 "setIconSize:",
                 ""
             )
             item.setTag_(size)
             item.setTarget_(self)
             size_menu.addItem_(item)
+            self._status_size_items[size] = item
 
         size_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             "アイコンサイズ", None, ""
@@ -769,16 +1076,17 @@ end tell
 
         # 監視間隔設定
         interval_menu = NSMenu.alloc().init()
+        self._status_interval_items = {}
         for interval in [10, 30, 50, 100, 200, 300, 500, 1000]:
-            label = f"{interval}ms" + (" ✓" if interval == self.config.check_interval else "")
             item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                label,
+                f"{interval}ms",
                 "setCheckInterval:",
                 ""
             )
             item.setTag_(interval)
             item.setTarget_(self)
             interval_menu.addItem_(item)
+            self._status_interval_items[interval] = item
 
         interval_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             "監視間隔", None, ""
@@ -788,16 +1096,17 @@ end tell
 
         # 透過度設定
         opacity_menu = NSMenu.alloc().init()
+        self._status_opacity_items = {}
         for opacity in [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]:
-            label = f"{opacity}%" + (" ✓" if opacity == self.config.opacity else "")
             item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                label,
+                f"{opacity}%",
                 "setOpacity:",
                 ""
             )
             item.setTag_(opacity)
             item.setTarget_(self)
             opacity_menu.addItem_(item)
+            self._status_opacity_items[opacity] = item
 
         opacity_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             "透過度", None, ""
@@ -808,22 +1117,22 @@ end tell
         menu.addItem_(NSMenuItem.separatorItem())
 
         # クリック透過設定
-        click_through_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "クリック透過" + (" ✓" if self.config.click_through else ""),
+        self._status_click_through_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            "クリック透過",
             "toggleClickThrough:",
             ""
         )
-        click_through_item.setTarget_(self)
-        menu.addItem_(click_through_item)
+        self._status_click_through_item.setTarget_(self)
+        menu.addItem_(self._status_click_through_item)
 
         # ?のとき非表示設定
-        hide_unknown_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "?のとき非表示" + (" ✓" if self.config.hide_unknown else ""),
+        self._status_hide_unknown_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            "?のとき非表示",
             "toggleHideUnknown:",
             ""
         )
-        hide_unknown_item.setTarget_(self)
-        menu.addItem_(hide_unknown_item)
+        self._status_hide_unknown_item.setTarget_(self)
+        menu.addItem_(self._status_hide_unknown_item)
 
         menu.addItem_(NSMenuItem.separatorItem())
 
@@ -846,14 +1155,14 @@ end tell
 
         menu.addItem_(NSMenuItem.separatorItem())
 
-        # エラー表示（unknown状態の時のみ表示するが、常に追加しておく）
-        error_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+        # エラー表示（unknown状態の時のみ表示）
+        self._status_error_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             "エラー表示",
             "showError:",
             ""
         )
-        error_item.setTarget_(self)
-        menu.addItem_(error_item)
+        self._status_error_item.setTarget_(self)
+        menu.addItem_(self._status_error_item)
 
         # アクセシビリティ設定を開く
         accessibility_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
@@ -867,14 +1176,13 @@ end tell
         menu.addItem_(NSMenuItem.separatorItem())
 
         # ログイン時に自動起動
-        is_login_item = self.isLoginItem()
-        login_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "ログイン時に自動起動" + (" ✓" if is_login_item else ""),
+        self._status_login_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            "ログイン時に自動起動",
             "toggleLoginItem:",
             ""
         )
-        login_item.setTarget_(self)
-        menu.addItem_(login_item)
+        self._status_login_item.setTarget_(self)
+        menu.addItem_(self._status_login_item)
 
         menu.addItem_(NSMenuItem.separatorItem())
 
@@ -898,7 +1206,28 @@ end tell
         quit_item.setTarget_(NSApplication.sharedApplication())
         menu.addItem_(quit_item)
 
+        # メニューを開く直前に状態を反映（menuNeedsUpdate:）
+        menu.setDelegate_(self)
         self.status_item.setMenu_(menu)
+        self.updateStatusBarMenu()
+
+    def menuNeedsUpdate_(self, menu):
+        """ステータスバーのメニューを開く直前に呼ばれる"""
+        self.updateStatusBarMenu()
+
+    def updateStatusBarMenu(self):
+        """ステータスバーのメニューのチェック状態を更新"""
+        config = self.config
+        for size, item in self._status_size_items.items():
+            item.setState_(NSOnState if size == config.icon_size else NSOffState)
+        for interval, item in self._status_interval_items.items():
+            item.setState_(NSOnState if interval == config.check_interval else NSOffState)
+        for opacity, item in self._status_opacity_items.items():
+            item.setState_(NSOnState if opacity == config.opacity else NSOffState)
+        self._status_click_through_item.setState_(NSOnState if config.click_through else NSOffState)
+        self._status_hide_unknown_item.setState_(NSOnState if config.hide_unknown else NSOffState)
+        self._status_error_item.setHidden_(self.last_error is None)
+        self._status_login_item.setState_(NSOnState if self.isLoginItem() else NSOffState)
 
     def updateStatusBarIcon_(self, is_muted):
         """メニューバーアイコンを更新"""
@@ -906,34 +1235,196 @@ end tell
             return
 
         # 状態に応じてアイコンファイルを選択
-        if is_muted is None:
-            icon_path = os.path.join(ICON_DIR, "unknown-512.png")
-        elif is_muted:
-            icon_path = os.path.join(ICON_DIR, "micOff-512.png")
-        else:
-            icon_path = os.path.join(ICON_DIR, "micOn-512.png")
-
-        if os.path.exists(icon_path):
-            icon = NSImage.alloc().initWithContentsOfFile_(icon_path)
+        if ICON_EXISTS[is_muted]:
+            icon = NSImage.alloc().initWithContentsOfFile_(ICON_PATHS[is_muted])
             if icon:
                 icon.setSize_(NSMakeSize(18, 18))
                 # テンプレートモードはミュート状態の時のみ無効（色を見せるため）
                 icon.setTemplate_(is_muted is None)
                 self.status_item.button().setImage_(icon)
 
+    def findZoomPid(self):
+        """起動中のZoomのプロセスIDを取得（起動していなければNone）"""
+        for app in NSWorkspace.sharedWorkspace().runningApplications():
+            if is_zoom_app(app):
+                return app.processIdentifier()
+        return None
+
+    def bindZoomObserver(self):
+        """ZoomにAXObserverを登録（成功したらTrue）"""
+        self.unbindZoomObserver()
+        self._ax_last_bind_attempt = time.monotonic()
+
+        pid = self.findZoomPid()
+        if pid is None:
+            return False
+
+        try:
+            def callback(observer, element, notification, refcon):
+                # 「ミーティング」メニュー内の変化だけを扱う（ウィンドウなど他の要素の通知は無視）
+                if not is_meeting_menu_element(element):
+                    return
+
+                if notification == kAXTitleChangedNotification and not self._ax_events_seen:
+                    # メニュー項目のタイトル変化を受け取れたので、以降はポーリングを保険程度に減らす
+                    self._ax_events_seen = True
+                    self.scheduleTimer()
+
+                self.updateStatus_(None)
+
+            err, observer = AXObserverCreate(pid, callback, None)
+            if err != kAXErrorSuccess or observer is None:
+                return False
+
+            app_element = AXUIElementCreateApplication(pid)
+            registered = False
+            for notification in AX_NOTIFICATIONS:
+                if AXObserverAddNotification(observer, app_element, notification, None) == kAXErrorSuccess:
+                    registered = True
+            if not registered:
+                return False
+
+            CFRunLoopAddSource(
+                NSRunLoop.mainRunLoop().getCFRunLoop(),
+                AXObserverGetRunLoopSource(observer),
+                kCFRunLoopDefaultMode
+            )
+            self._ax_observer = observer
+            self._ax_callback = callback
+            return True
+        except Exception as e:
+            print(f"Failed to create AX observer: {e}")
+            return False
+
+    def updateObserverState_(self, is_muted):
+        """ポーリング結果に合わせてAXObserverの状態を更新"""
+        # 起動直後などで登録に失敗していたら、一定間隔で再試行
+        if self._ax_observer is None:
+            if self._zoom_running and time.monotonic() - self._ax_last_bind_attempt >= AX_RETRY_INTERVAL:
+                self.bindZoomObserver()
+            return
+
+        # ミーティングが終わったら、次に通知が届くまではユーザー設定の間隔でポーリング
+        if is_muted is None and self._ax_events_seen:
+            self._ax_events_seen = False
+            self.scheduleTimer()
+
+    def unbindZoomObserver(self):
+        """AXObserverの登録を解除"""
+        if self._ax_observer is None:
+            return
+
+        CFRunLoopRemoveSource(
+            NSRunLoop.mainRunLoop().getCFRunLoop(),
+            AXObserverGetRunLoopSource(self._ax_observer),
+            kCFRunLoopDefaultMode
+        )
+        self._ax_observer = None
+        self._ax_callback = None
+        if self._ax_events_seen:
+            self._ax_events_seen = False
+            self.scheduleTimer()
+
+    def applicationWillTerminate_(self, notification):
+        """アプリ終了時に未保存の設定を書き出す"""
+        if self.config.dirty:
+            self.config.save()
+
+    def applicationDidLaunch_(self, notification):
+        """アプリ起動通知（Zoomが起動したらAXObserverを登録し直す）"""
+        app = notification.userInfo()["NSWorkspaceApplicationKey"]
+        if not is_zoom_app(app):
+            return
+
+        self._zoom_running = True
+        self.bindZoomObserver()
+        self.scheduleTimer()
+        self.setTimerActive_(True)
+        self.updateStatus_(None)
+
+    def applicationDidTerminate_(self, notification):
+        """アプリ終了通知（Zoomが終了したらAXObserverを解除）"""
+        app = notification.userInfo()["NSWorkspaceApplicationKey"]
+        if not is_zoom_app(app):
+            return
+
+        # 他のZoomがまだ起動していればそちらの監視を続ける
+        self._zoom_running = self.findZoomPid() is not None
+        if self._zoom_running:
+            self.bindZoomObserver()
+            return
+
+        # Zoomが起動していない間はタイマーを止める（表示は「起動していません」に更新）
+        self.unbindZoomObserver()
+        self.setTimerActive_(False)
+        self.updateStatus_(None)
+
+    def setTimerActive_(self, active):
+        """タイマーを再開/一時停止（dispatch_resume/suspendの回数を揃える）"""
+        if self._timer_source is None or active != self._timer_suspended:
+            return
+
+        if active:
+            dispatch.dispatch_resume(self._timer_source)
+        else:
+            dispatch.dispatch_suspend(self._timer_source)
+        self._timer_suspended = not active
+
+    def scheduleTimer(self):
+        """監視間隔に合わせてタイマーを設定"""
+        if self._timer_source is None:
+            return
+
+        # 「ミーティング」メニューの変化通知が実際に届いている間だけ、保険として低頻度でポーリング
+        # （届くまではユーザー設定の間隔のまま）
+        interval = self.config.check_interval
+        if self._ax_events_seen:
+            interval = max(interval, AX_FALLBACK_INTERVAL)
+
+        # ミリ秒をナノ秒に変換し、間隔の20%をleewayとして与える（OSがウェイクアップをまとめられるように）
+        interval_ns = interval * 1000000
+        leeway_ns = interval_ns // 5
+        dispatch.dispatch_source_set_timer(
+            self._timer_source,
+            dispatch.dispatch_time(dispatch.DISPATCH_TIME_NOW, interval_ns),
+            interval_ns,
+            leeway_ns
+        )
+
     def startMonitoring(self):
         """監視を開始"""
         self.setupStatusBar()  # メニューバーアイテムを設定
         self.setupWindow()
 
-        # 設定された間隔でチェック
-        self.timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            self.config.check_interval / 1000.0,  # ミリ秒を秒に変換
-            self,
-            'updateStatus:',
-            None,
-            True
+        # Zoomの起動・終了を監視し、メニューの変化はAXObserverで検知する
+        workspace_center = NSWorkspace.sharedWorkspace().notificationCenter()
+        workspace_center.addObserver_selector_name_object_(
+            self, 'applicationDidLaunch:', NSWorkspaceDidLaunchApplicationNotification, None
+        )
+        workspace_center.addObserver_selector_name_object_(
+            self, 'applicationDidTerminate:', NSWorkspaceDidTerminateApplicationNotification, None
         )
+        self.bindZoomObserver()
+
+        # 終了時に保存待ちの設定を書き出す
+        NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+            self, 'applicationWillTerminate:', NSApplicationWillTerminateNotification, None
+        )
+
+        # 設定された間隔でチェック（メインキュー上のdispatchタイマー）
+        self._timer_source = dispatch.dispatch_source_create(
+            dispatch.DISPATCH_SOURCE_TYPE_TIMER, 0, 0, dispatch.dispatch_get_main_queue()
+        )
+        dispatch.dispatch_source_set_event_handler(
+            self._timer_source, lambda: self.updateStatus_(None)
+        )
+        self.scheduleTimer()
+        dispatch.dispatch_resume(self._timer_source)
+        self._timer_suspended = False
+
+        # Zoomが起動していなければ、起動するまでタイマーを止めておく
+        if not self._zoom_running:
+            self.setTimerActive_(False)
 
         # 初回チェック
         self.updateStatus_(None)